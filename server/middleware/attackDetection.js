@@ -15,14 +15,9 @@ const SUSPICIOUS_PATTERNS = {
     /(union\s+select|drop\s+table|insert\s+into)/i,   // SQL injection
     /(\{\s*"\$)/,  // MongoDB operator injection
   ],
-  // XSS patterns
+  // XSS patterns - single alternation so each value is scanned once
   xss: [
-    /<script[\s>]/i,
-    /javascript:/i,
-    /on\w+\s*=/i,  // onclick=, onerror=, etc.
-    /<iframe/i,
-    /<object/i,
-    /<embed/i,
+    /<script[\s>]|javascript:|on\w+\s*=|<iframe|<object|<embed/i,  // on\w+= covers onclick=, onerror=, etc.
   ],
   // Path traversal
   pathTraversal: [
@@ -21,7 +21,7 @@ import {
   limitLoginHistory,
   getIpGeolocation
 } from '../utils/sessionUtils.js';
-import { getCountryFromRequest, requiresSafetyCheck as checkSafetyRequired, HIGH_RISK_COUNTRIES } from '../utils/geoService.js';
+import { getCountryFromRequest, requiresSafetyCheck as checkSafetyRequired, isHighRiskCountry } from '../utils/geoService.js';
 import { logEmailVerification, logPasswordChange, logFailedAuth, logAccountLocked } from '../utils/securityLogger.js';
 import { loginLimiter, signupLimiter, passwordResetLimiter, passwordResetEmailLimiter, resendVerificationLimiter, checkUsernameLimiter, resetPasswordConfirmLimiter } from '../middleware/rateLimiter.js';
 import { validateSignup, validateLogin } from '../middleware/validation.js';
@@ -520,7 +520,7 @@ router.post('/signup', validateAgeBeforeRateLimit, signupLimiter, validateSignup
     if (countryCode) {
       user.lastCountryCode = countryCode;
       // Privacy nudge: default to nickname in high-risk countries
-      if (HIGH_RISK_COUNTRIES.includes(countryCode) && user.displayNameType === 'fullName') {
+      if (isHighRiskCountry(countryCode) && user.displayNameType === 'fullName') {
         user.displayNameType = 'nickname';
       }
       await user.save();
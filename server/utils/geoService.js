@@ -41,6 +41,18 @@ export const EXTREME_RISK_COUNTRIES = [
   'AF', 'BN', 'IR', 'MR', 'NG', 'QA', 'SA', 'SO', 'AE', 'YE'
 ];
 
+// Set for O(1) membership checks on the request path
+const HIGH_RISK_COUNTRY_SET = new Set(HIGH_RISK_COUNTRIES);
+
+/**
+ * Check if a country code is in the high-risk list (case-insensitive)
+ * @param {string} countryCode
+ * @returns {boolean}
+ */
+export function isHighRiskCountry(countryCode) {
+  return !!countryCode && HIGH_RISK_COUNTRY_SET.has(countryCode.toUpperCase());
+}
+
 /**
  * Check if an IP is local/private (skip geo lookup for these)
  */
@@ -146,7 +158,7 @@ export async function getCountryFromRequest(req) {
  * Determine if a safety check is required for a user in a given country.
  */
 export function requiresSafetyCheck(countryCode, user) {
-  if (!countryCode || !HIGH_RISK_COUNTRIES.includes(countryCode.toUpperCase())) {
+  if (!isHighRiskCountry(countryCode)) {
     return false;
   }
 